@@ -0,0 +1,93 @@
+import hashlib
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.http import Http404
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def _reads_relation(serializer, relation):
+    field_relations = getattr(serializer, 'field_relations', {})
+    for name, field in serializer.fields.items():
+        paths = field_relations.get(name) or (field.source.replace('.', '__'),)
+        if any(path.startswith(f'{relation}__') for path in paths):
+            return True
+    return False
+
+
+class ConditionalGetViewMixin:
+    """
+    Answer list and retrieve calls with 304 Not Modified while their rows are unchanged.
+
+    The ETag comes from one aggregate over the filtered queryset (or the
+    single row on retrieve): the row count and the latest
+    ``last_modified_field``, plus the count and latest timestamp of every
+    relation in ``last_modified_relations`` that a kept field reads. A
+    matching If-None-Match returns before the page is read or serialized,
+    and when it is sent If-Modified-Since is ignored.
+
+    Last-Modified is only sent where a later timestamp is the only way the
+    response can change: on retrieve, when no embedded reverse relation
+    can lose rows without touching the row itself, and once the second of
+    the latest change has passed. Lists can lose rows without any
+    timestamp moving, so they carry the ETag alone.
+    """
+    last_modified_field = 'updated_at'
+    # Relation name -> its timestamp field, for related rows the representation embeds.
+    last_modified_relations = {}
+
+    def get_validators(self, queryset, single_row=False):
+        """(ETag, Last-Modified timestamp or None) of ``queryset``, or None when it has no rows."""
+        serializer = self.get_serializer()
+        relations = [relation for relation in self.last_modified_relations if _reads_relation(serializer, relation)]
+        aggregates = {'count': Count('pk'), 'latest': Max(self.last_modified_field)}
+        for relation in relations:
+            aggregates[f'{relation}_count'] = Count(relation)
+            aggregates[f'{relation}_latest'] = Max(f'{relation}__{self.last_modified_relations[relation]}')
+        values = queryset.select_related(None).prefetch_related(None).order_by().aggregate(**aggregates)
+        if not values['count']:
+            return None
+        fingerprint = ':'.join(f'{name}={values[name]!r}' for name in sorted(values))
+        etag = quote_etag(hashlib.sha256(fingerprint.encode()).hexdigest()[:32])
+
+        model = queryset.model
+        if not single_row or any(model._meta.get_field(relation).auto_created for relation in relations):
+            return etag, None
+        latest = [value for name, value in values.items() if name.endswith('latest') and value is not None]
+        if not latest:
+            return etag, None
+        last_modified = int(max(latest).timestamp())
+        # Another change within the same second would not move a one-second Last-Modified.
+        if last_modified >= int(timezone.now().timestamp()):
+            return etag, None
+        return etag, last_modified
+
+    def _conditional(self, request, queryset, render, *args, single_row=False, **kwargs):
+        validators = self.get_validators(queryset, single_row)
+        if validators is None:
+            return render(request, *args, **kwargs)
+        etag, last_modified = validators
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = render(request, *args, **kwargs)
+        if response.status_code in (200, 304):
+            response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(last_modified)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        return self._conditional(request, queryset, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        # A lookup value the field cannot take (e.g. a non-numeric pk) is a 404, as in get_object().
+        try:
+            queryset = self.filter_queryset(self.get_queryset()).filter(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+        except (TypeError, ValueError, ValidationError):
+            raise Http404
+        return self._conditional(request, queryset, super().retrieve, *args, single_row=True, **kwargs)
@@ -0,0 +1,107 @@
+from django.conf import settings
+from rest_framework import relations, serializers
+from rest_framework.generics import get_object_or_404
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+# Fields whose to_representation returns a str, int or bool value from the database unchanged.
+PASSTHROUGH_FIELDS = (
+    serializers.CharField,
+    serializers.IntegerField,
+    serializers.ReadOnlyField,
+    relations.PrimaryKeyRelatedField,
+)
+
+
+def _file_url(field, request):
+    storage = field.parent.Meta.model._meta.get_field(field.source).storage
+    use_url = getattr(field, 'use_url', api_settings.UPLOADED_FILES_USE_URL)
+
+    def convert(name):
+        if not name:
+            return None
+        if not use_url:
+            return name
+        url = storage.url(name)
+        return request.build_absolute_uri(url) if request is not None else url
+    return convert
+
+
+def _skip_none(convert):
+    def mapped(value):
+        return None if value is None else convert(value)
+    return mapped
+
+
+def compile_row_mapper(serializer, request=None):
+    """
+    Turn a serializer's fields into (output name, values() path, converter) triples.
+
+    Converters reuse each field's own to_representation, except for plain
+    passthrough fields, so rows built from ``.values()`` render to the same
+    JSON as the serializer. Returns None when any kept field cannot be read
+    from a single column (nested serializers, ``source='*'`` or method fields
+    the serializer does not map through ``value_fields``).
+    """
+    value_fields = getattr(serializer, 'value_fields', {})
+    mapper = []
+    for name, field in serializer.fields.items():
+        if isinstance(field, serializers.SerializerMethodField):
+            if name not in value_fields:
+                return None
+            path, convert = value_fields[name]
+        elif isinstance(field, (serializers.BaseSerializer, relations.ManyRelatedField)) or field.source == '*':
+            return None
+        elif isinstance(field, serializers.FileField):
+            path, convert = field.source, _file_url(field, request)
+        else:
+            path = field.source.replace('.', '__')
+            convert = None if isinstance(field, PASSTHROUGH_FIELDS) else _skip_none(field.to_representation)
+        mapper.append((name, path, convert))
+    return mapper
+
+
+def map_row(mapper, row):
+    return {name: convert(row[path]) if convert else row[path] for name, path, convert in mapper}
+
+
+class FastReadViewMixin:
+    """
+    Serve list and retrieve calls from ``.values()`` rows when the serializer allows it.
+
+    The rows skip model instances and per-field attribute lookups but go
+    through the same field converters, so the JSON is byte-identical to the
+    serializer's. Falls back to the serializer whenever a kept field cannot
+    be mapped, and is switched off entirely by ``FAST_READ_SERIALIZATION``.
+    """
+
+    def get_row_mapper(self):
+        if not getattr(settings, 'FAST_READ_SERIALIZATION', True):
+            return None
+        return compile_row_mapper(self.get_serializer(), self.request)
+
+    def _values_queryset(self, mapper):
+        queryset = self.filter_queryset(self.get_queryset()).select_related(None).prefetch_related(None)
+        ordering = getattr(self.pagination_class, 'ordering', ())
+        paths = {path for _, path, _ in mapper}
+        paths.update(name.lstrip('-') for name in ordering if name.lstrip('-') != 'pk')
+        paths.add(queryset.model._meta.pk.attname)
+        return queryset.values(*paths)
+
+    def list(self, request, *args, **kwargs):
+        mapper = self.get_row_mapper()
+        if mapper is None:
+            return super().list(request, *args, **kwargs)
+        queryset = self._values_queryset(mapper)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response([map_row(mapper, row) for row in page])
+        return Response([map_row(mapper, row) for row in queryset])
+
+    def retrieve(self, request, *args, **kwargs):
+        mapper = self.get_row_mapper()
+        if mapper is None:
+            return super().retrieve(request, *args, **kwargs)
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        row = get_object_or_404(self._values_queryset(mapper), **{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        return Response(map_row(mapper, row))
@@ -0,0 +1,102 @@
+def _parse_names(value):
+    return {name.strip() for name in value.split(',') if name.strip()}
+
+
+class SparseFieldsSerializerMixin:
+    """
+    Serializer that can drop fields it was not asked for.
+
+    ``fields`` names the plain fields to keep (None keeps all of them) and
+    ``expand`` names the nested relations listed in ``expandable_fields``.
+    Nested relations are only emitted on request once either option is set.
+    ``field_relations`` maps method fields to the related columns they read,
+    so the queryset can join exactly what the kept fields need.
+    """
+    expandable_fields = {}
+    field_relations = {}
+
+    def __init__(self, *args, fields=None, expand=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is None and expand is None:
+            return
+        wanted = (fields or set()) | (expand or set())
+        for name in list(self.fields):
+            if name in self.expandable_fields:
+                keep = name in wanted
+            else:
+                keep = fields is None or name in fields
+            if not keep:
+                self.fields.pop(name)
+
+
+def restrict_queryset(queryset, serializer, extra_columns=()):
+    """
+    Load only the columns and relations the serializer's kept fields read.
+
+    Plain fields become ``only()`` columns, dotted sources and
+    ``field_relations`` become joins, and expandable fields become the
+    prefetches declared for them. ``extra_columns`` keeps columns the view
+    needs itself, such as the pagination ordering.
+    """
+    model = queryset.model
+    columns = {model._meta.pk.name, *extra_columns}
+    joins = set()
+    prefetches = []
+    for name, field in serializer.fields.items():
+        if name in serializer.expandable_fields:
+            prefetches.append(serializer.expandable_fields[name])
+        elif name in serializer.field_relations:
+            for path in serializer.field_relations[name]:
+                columns.add(path)
+                joins.add(path.rsplit('__', 1)[0])
+        elif field.source != '*' and '.' in field.source:
+            path = field.source.replace('.', '__')
+            columns.add(path)
+            joins.add(path.rsplit('__', 1)[0])
+        elif field.source != '*':
+            columns.add(field.source)
+
+    queryset = queryset.select_related(None).prefetch_related(None)
+    if joins:
+        queryset = queryset.select_related(*joins)
+    if prefetches:
+        queryset = queryset.prefetch_related(*prefetches)
+    return queryset.only(*columns)
+
+
+class SparseFieldsViewMixin:
+    """
+    Honour ``?fields=`` and ``?expand=`` on list and retrieve calls.
+
+    The serializer is trimmed to the requested fields and the queryset is
+    narrowed to match, so a dropdown asking for two columns reads two columns.
+    """
+    fields_query_param = 'fields'
+    expand_query_param = 'expand'
+
+    def get_sparse_options(self):
+        if self.request.method != 'GET' or getattr(self, 'action', None) not in ('list', 'retrieve'):
+            return None
+        params = self.request.query_params
+        if self.fields_query_param not in params and self.expand_query_param not in params:
+            return None
+        fields = params.get(self.fields_query_param)
+        return {
+            'fields': _parse_names(fields) if fields is not None else None,
+            'expand': _parse_names(params.get(self.expand_query_param, '')),
+        }
+
+    def get_serializer(self, *args, **kwargs):
+        options = self.get_sparse_options()
+        if options is not None:
+            kwargs.update(options)
+        return super().get_serializer(*args, **kwargs)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        options = self.get_sparse_options()
+        if options is None:
+            return queryset
+        ordering = getattr(self.pagination_class, 'ordering', ())
+        extra_columns = [name.lstrip('-') for name in ordering if name.lstrip('-') != 'pk']
+        return restrict_queryset(queryset, self.get_serializer_class()(**options), extra_columns)
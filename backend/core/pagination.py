@@ -0,0 +1,145 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime, time
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+def seek_filter(ordering, values):
+    """
+    Rows after ``values`` in ``ordering``: (a, b) > (x, y) as a OR of AND terms.
+
+    The redundant a >= x bound in front gives the planner a range start on
+    the leading index column, which it cannot derive from the OR alone.
+    """
+    condition = Q()
+    equal = Q()
+    for name, value in zip(ordering, values):
+        field = name.lstrip('-')
+        lookup = 'lt' if name.startswith('-') else 'gt'
+        condition |= equal & Q(**{f'{field}__{lookup}': value})
+        equal &= Q(**{field: value})
+    if len(ordering) > 1:
+        first = ordering[0]
+        condition = Q(**{f"{first.lstrip('-')}__{'lte' if first.startswith('-') else 'gte'}": values[0]}) & condition
+    return condition
+
+
+def _cursor_value(value):
+    # Full isoformat keeps microseconds, which DjangoJSONEncoder would truncate.
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    return str(value)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Seek pagination over a fixed ordering.
+
+    The cursor is an opaque token holding the ordering values of the last row
+    on the previous page, and the next page is the rows strictly after it. An
+    index on the ordering columns therefore serves every page as a range
+    scan, whatever the depth. The last ordering field must be unique and none
+    of them may be null. Ordering fields may be annotations of the queryset,
+    which lets an expression index serve the pages.
+
+    Responses carry the total row count unless ``include_count`` is off or
+    the client sends ``?count=false``; counting is the one part of a page
+    whose cost still grows with the table.
+    """
+    ordering = ('-pk',)
+    page_size = 50
+    max_page_size = 200
+    page_size_query_param = 'page_size'
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+    include_count = True
+    invalid_cursor_message = 'Invalid cursor.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.model = queryset.model
+        self.annotations = queryset.query.annotations
+        page_size = self.get_page_size(request)
+        queryset = queryset.order_by(*self.ordering)
+        self.count = queryset.count() if self.get_include_count(request) else None
+
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded:
+            queryset = queryset.filter(self._seek(self.decode_cursor(encoded)))
+
+        rows = list(queryset[:page_size + 1])
+        self.has_next = len(rows) > page_size
+        self.page = rows[:page_size]
+        return self.page
+
+    def get_paginated_response(self, data):
+        payload = {'next': self.get_next_link(), 'results': data}
+        if self.count is not None:
+            payload = {'count': self.count, **payload}
+        return Response(payload)
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'count': {'type': 'integer'},
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+
+    def get_include_count(self, request):
+        value = request.query_params.get(self.count_query_param)
+        if value is None:
+            return self.include_count
+        return value.lower() not in ('0', 'false', 'no', 'off')
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        values = [self._row_value(last, name) for name in self._field_names()]
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, self.encode_cursor(values))
+
+    def encode_cursor(self, values):
+        raw = json.dumps(values, default=_cursor_value, separators=(',', ':')).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    def decode_cursor(self, encoded):
+        try:
+            raw = base64.urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4))
+            values = json.loads(raw)
+            fields = [self._model_field(name) for name in self._field_names()]
+            if not isinstance(values, list) or len(values) != len(fields):
+                raise ValueError
+            return [field.to_python(value) for field, value in zip(fields, values)]
+        except (binascii.Error, ValueError, TypeError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def _field_names(self):
+        return [name.lstrip('-') for name in self.ordering]
+
+    def _model_field(self, name):
+        if name in self.annotations:
+            return self.annotations[name].output_field
+        return self.model._meta.pk if name == 'pk' else self.model._meta.get_field(name)
+
+    def _row_value(self, row, name):
+        attname = name if name in self.annotations else self._model_field(name).attname
+        return row[attname] if isinstance(row, dict) else getattr(row, attname)
+
+    def _seek(self, values):
+        return seek_filter(self.ordering, values)
@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/6.0/ref/settings/
 import os
 from pathlib import Path
 import environ
+from corsheaders.defaults import default_headers
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -80,6 +81,8 @@ CORS_ALLOWED_ORIGINS = _get_env_list(
     'DJANGO_CORS_ALLOWED_ORIGINS',
     'http://localhost:3000,http://127.0.0.1:3000'
 )
+# Integration clients send Idempotency-Key on purchase order writes.
+CORS_ALLOW_HEADERS = (*default_headers, 'idempotency-key')
 ROOT_URLCONF = 'core.urls'
 
 TEMPLATES = [
@@ -128,6 +131,40 @@ else:
     }
 
 
+# Caches
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+# Report responses are cached in the 'reports' cache. 'locmem' keeps entries in
+# each worker process; 'file' shares them between workers through REPORT_CACHE_DIR.
+# Keys carry table versions, bumped right after each write commits. If the process dies
+# between that commit and the bump, reports keep serving pre-write rows until the next
+# write to the same table or until REPORT_CACHE_TIMEOUT (seconds) expires them.
+REPORT_CACHE_BACKEND = os.getenv('REPORT_CACHE_BACKEND', 'locmem').strip().lower()
+REPORT_CACHE_TIMEOUT = int(os.getenv('REPORT_CACHE_TIMEOUT', '3600'))
+
+if REPORT_CACHE_BACKEND == 'file':
+    REPORT_CACHE = {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.getenv('REPORT_CACHE_DIR', str(BASE_DIR / 'cache' / 'reports')),
+    }
+else:
+    REPORT_CACHE = {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'vendorpulse-reports',
+    }
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'reports': {
+        **REPORT_CACHE,
+        'TIMEOUT': REPORT_CACHE_TIMEOUT,
+        'OPTIONS': {'MAX_ENTRIES': int(os.getenv('REPORT_CACHE_MAX_ENTRIES', '1000'))},
+    },
+}
+
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -180,3 +217,23 @@ SIMPLE_JWT = {
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
     'AUTH_HEADER_TYPES': ('Bearer',),
 }
+
+# Run queued vendor score recalculations on an in-process thread. Disable when
+# jobs are processed by the run_vendor_score_jobs command instead.
+VENDOR_SCORE_BACKGROUND_WORKER = _get_env_bool('VENDOR_SCORE_BACKGROUND_WORKER', True)
+
+# A running recalculation job whose worker has not reported progress for this
+# long is marked Failed, so a crashed worker does not leave it running forever.
+VENDOR_SCORE_JOB_TIMEOUT_MINUTES = int(os.getenv('VENDOR_SCORE_JOB_TIMEOUT_MINUTES', '30'))
+
+# Serve read-only vendor list and detail calls from values() rows instead of
+# model serializers. Output is identical; disable to fall back to DRF.
+FAST_READ_SERIALIZATION = _get_env_bool('FAST_READ_SERIALIZATION', True)
+
+# How long a stored Idempotency-Key response is replayed before it can be purged.
+IDEMPOTENCY_KEY_TTL_HOURS = int(os.getenv('IDEMPOTENCY_KEY_TTL_HOURS', '24'))
+
+# How long a request that has claimed an Idempotency-Key but not yet stored its
+# response holds the key. A retry after that takes the key over, so a worker that
+# crashed mid-request does not block the key for the whole TTL.
+IDEMPOTENCY_KEY_LEASE_SECONDS = int(os.getenv('IDEMPOTENCY_KEY_LEASE_SECONDS', '120'))
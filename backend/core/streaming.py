@@ -0,0 +1,90 @@
+import csv
+import json
+import zlib
+from django.http import StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+from core.pagination import seek_filter
+
+EXPORT_CHUNK_SIZE = 2000
+EXPORT_FORMATS = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+def iterate_keyset(queryset, ordering, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Yield ``queryset`` rows in chunks of at most ``chunk_size``, one query per chunk.
+
+    Each chunk seeks past the last row of the previous one on ``ordering``
+    (whose last field must be unique), so memory stays flat on every backend,
+    including MySQL, where iterator() still buffers the whole result set.
+    ``queryset`` must be a values() queryset that includes the ordering fields.
+    """
+    fields = [name.lstrip('-') for name in ordering]
+    queryset = queryset.order_by(*ordering)
+    last = None
+    while True:
+        chunk_queryset = queryset if last is None else queryset.filter(seek_filter(ordering, last))
+        rows = list(chunk_queryset[:chunk_size])
+        if not rows:
+            return
+        yield rows
+        if len(rows) < chunk_size:
+            return
+        last = [rows[-1][field] for field in fields]
+
+
+class _Echo:
+    """File-like object whose write() hands the line back, for csv.writer."""
+
+    def write(self, value):
+        return value
+
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, cls=JSONEncoder)
+    return value
+
+
+def _csv_chunks(columns, row_chunks):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(columns)
+    for rows in row_chunks:
+        yield ''.join(writer.writerow([_csv_value(row[column]) for column in columns]) for row in rows)
+
+
+def _ndjson_chunks(columns, row_chunks):
+    encoder = JSONEncoder(separators=(',', ':'))
+    for rows in row_chunks:
+        yield ''.join(encoder.encode({column: row[column] for column in columns}) + '\n' for row in rows)
+
+
+def _gzip(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode())
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_response(row_chunks, columns, export_format, filename, compress=False):
+    """
+    Stream ``row_chunks`` (an iterable of lists of row dicts) as CSV or NDJSON.
+
+    Each chunk is encoded and sent as it is produced, and with ``compress``
+    the body goes out gzip-encoded, so neither the rows nor the file are
+    ever held in memory as a whole.
+    """
+    chunks = (_csv_chunks if export_format == 'csv' else _ndjson_chunks)(columns, row_chunks)
+    if compress:
+        chunks = _gzip(chunks)
+    response = StreamingHttpResponse(chunks, content_type=EXPORT_FORMATS[export_format])
+    response['Content-Disposition'] = f'attachment; filename="{filename}.{export_format}"'
+    if compress:
+        response['Content-Encoding'] = 'gzip'
+    return response
@@ -6,6 +6,7 @@ from rest_framework import status
 from django.utils import timezone
 from datetime import datetime, timedelta
 from django.db import models
+from core.streaming import EXPORT_FORMATS, export_response, iterate_keyset
 from .permissions import IsAdmin
 from .models import UserActivityLog
 from .services.activity_service import (
@@ -15,6 +16,12 @@ from .services.activity_service import (
 
 User = get_user_model()
 
+MAX_ACTIVITY_LOG_LIMIT = 500
+ACTIVITY_EXPORT_COLUMNS = [
+    'id', 'user_id', 'username', 'action', 'ip_address', 'user_agent',
+    'timestamp', 'username_attempted', 'success', 'details',
+]
+
 # Admin Activity Log Views
 class AdminActivityLogsView(APIView):
     """Admin-only access to user activity logs"""
@@ -28,13 +35,25 @@ class AdminActivityLogsView(APIView):
         start_date = request.query_params.get('start_date')
         end_date = request.query_params.get('end_date')
         ip_address = request.query_params.get('ip_address')
-        limit = int(request.query_params.get('limit', 100))
+        try:
+            limit = int(request.query_params.get('limit', 100))
+        except ValueError:
+            return Response({
+                "success": False,
+                "message": "limit must be an integer."
+            }, status=status.HTTP_400_BAD_REQUEST)
+        limit = min(max(limit, 1), MAX_ACTIVITY_LOG_LIMIT)
         
         # Convert user_id to User object if provided
         user = None
         if user_id:
             try:
-                user = User.objects.get(id=user_id)
+                user = User.objects.get(id=int(user_id))
+            except ValueError:
+                return Response({
+                    "success": False,
+                    "message": "user_id must be an integer."
+                }, status=status.HTTP_400_BAD_REQUEST)
             except User.DoesNotExist:
                 return Response({
                     "success": False,
@@ -105,6 +124,54 @@ class AdminActivityLogsView(APIView):
             }
         })
 
+class AdminActivityLogExportView(APIView):
+    """Admin-only streaming export of every activity log in a time range"""
+    permission_classes = [IsAuthenticated, IsAdmin]
+
+    def get(self, request):
+        """Stream logs oldest first as CSV or NDJSON, without the list view's row limit"""
+        export_format = request.query_params.get('output', 'csv')
+        if export_format not in EXPORT_FORMATS:
+            return Response({
+                "success": False,
+                "message": f"output must be one of {sorted(EXPORT_FORMATS)}."
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        filters = {}
+        for param, lookup in (('start_date', 'timestamp__gte'), ('end_date', 'timestamp__lte')):
+            value = request.query_params.get(param)
+            if not value:
+                continue
+            try:
+                moment = datetime.fromisoformat(value.replace('Z', '+00:00'))
+            except ValueError:
+                return Response({
+                    "success": False,
+                    "message": f"Invalid {param} format. Use ISO format."
+                }, status=status.HTTP_400_BAD_REQUEST)
+            filters[lookup] = timezone.make_aware(moment) if timezone.is_naive(moment) else moment
+        if request.query_params.get('user_id'):
+            try:
+                filters['user_id'] = int(request.query_params['user_id'])
+            except ValueError:
+                return Response({
+                    "success": False,
+                    "message": "user_id must be an integer."
+                }, status=status.HTTP_400_BAD_REQUEST)
+        if request.query_params.get('action'):
+            filters['action'] = request.query_params['action']
+
+        logs = UserActivityLog.objects.filter(**filters).values(
+            'id', 'user_id', 'user__username', 'action', 'ip_address', 'user_agent',
+            'timestamp', 'username_attempted', 'success', 'details',
+        )
+        row_chunks = (
+            [{**row, 'username': row['user__username'], 'timestamp': row['timestamp'].isoformat()} for row in rows]
+            for rows in iterate_keyset(logs, ('timestamp', 'id'))
+        )
+        compress = request.query_params.get('gzip', '').lower() in ('1', 'true', 'yes')
+        return export_response(row_chunks, ACTIVITY_EXPORT_COLUMNS, export_format, 'activity-logs', compress=compress)
+
 class AdminFailedLoginsView(APIView):
     """Admin-only access to failed login attempts"""
     permission_classes = [IsAuthenticated, IsAdmin]
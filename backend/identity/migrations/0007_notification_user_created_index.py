@@ -0,0 +1,17 @@
+# Generated by Django 4.2.27 on 2026-10-18 16:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_update_profile_role_ops'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', 'created_at', 'id'], name='notification_user_created_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.27 on 2026-10-18 16:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_notification_user_created_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='useractivitylog',
+            index=models.Index(fields=['timestamp', 'id'], name='activity_log_timestamp_idx'),
+        ),
+    ]
@@ -51,6 +51,7 @@ class UserActivityLog(models.Model):
             models.Index(fields=['user', 'timestamp']),
             models.Index(fields=['action', 'timestamp']),
             models.Index(fields=['ip_address', 'timestamp']),
+            models.Index(fields=['timestamp', 'id'], name='activity_log_timestamp_idx'),
         ]
     
     def __str__(self):
@@ -72,6 +73,9 @@ class Notification(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', 'created_at', 'id'], name='notification_user_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.notif_type}: {self.message[:40]}"
@@ -0,0 +1,9 @@
+from core.pagination import KeysetPagination
+
+
+class NotificationPagination(KeysetPagination):
+    ordering = ('-created_at', '-id')
+
+
+class UserPagination(KeysetPagination):
+    ordering = ('id',)
@@ -86,7 +86,7 @@ def get_user_activity_logs(user=None, action=None, start_date=None, end_date=Non
     Returns:
         QuerySet of UserActivityLog objects
     """
-    logs = UserActivityLog.objects.all()
+    logs = UserActivityLog.objects.select_related('user')
     
     if user:
         logs = logs.filter(user=user)
@@ -1,3 +1,76 @@
+import csv
+import io
+import json
+from django.contrib.auth.models import User
 from django.test import TestCase
+from rest_framework.test import APIClient
+from .models import Notification, UserActivityLog
 
-# Create your tests here.
+
+class ListBoundsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser('admin', 'admin@example.com', 'password123')
+        for index in range(4):
+            User.objects.create_user(f'user{index}', f'user{index}@example.com', 'password123')
+        Notification.objects.bulk_create([
+            Notification(user=cls.admin, notif_type='LOW_STOCK', message=f'Alert {index}') for index in range(3)
+        ])
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_users_are_paged(self):
+        page = self.client.get('/api/accounts/users/?page_size=3').json()
+        self.assertEqual(page['count'], 5)
+        self.assertEqual(len(page['results']), 3)
+        rest = self.client.get(page['next']).json()
+        self.assertEqual(len(rest['results']), 2)
+        self.assertIsNone(rest['next'])
+
+    def test_notifications_are_paged_newest_first(self):
+        page = self.client.get('/api/accounts/notifications/?page_size=2').json()
+        self.assertEqual([item['message'] for item in page['results']], ['Alert 2', 'Alert 1'])
+        self.assertIsNotNone(page['next'])
+
+    def test_activity_log_limit_is_bounded(self):
+        self.assertEqual(self.client.get('/api/accounts/admin/activity-logs/?limit=abc').status_code, 400)
+        response = self.client.get('/api/accounts/admin/activity-logs/?limit=1000000')
+        self.assertEqual(response.json()['filters_applied']['limit'], 500)
+
+
+class ActivityLogExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser('admin', 'admin@example.com', 'password123')
+        UserActivityLog.objects.bulk_create([
+            UserActivityLog(user=cls.admin if index % 2 else None, action='LOGIN', ip_address='10.0.0.1',
+                            username_attempted='admin', details={'attempt': index})
+            for index in range(3)
+        ])
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_streams_every_log_as_csv(self):
+        response = self.client.get('/api/accounts/admin/activity-logs/export/')
+        self.assertEqual(response.status_code, 200)
+        rows = list(csv.DictReader(io.StringIO(b''.join(response.streaming_content).decode())))
+        self.assertEqual([row['details'] for row in rows], ['{"attempt": 0}', '{"attempt": 1}', '{"attempt": 2}'])
+        self.assertEqual([row['username'] for row in rows], ['', 'admin', ''])
+
+    def test_ndjson_and_date_filter(self):
+        response = self.client.get('/api/accounts/admin/activity-logs/export/?output=ndjson&start_date=2000-01-01')
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[1]['user_id'], self.admin.pk)
+        self.assertEqual(self.client.get('/api/accounts/admin/activity-logs/export/?end_date=soon').status_code, 400)
+
+    def test_user_filter_must_be_an_id(self):
+        response = self.client.get(f'/api/accounts/admin/activity-logs/export/?output=ndjson&user_id={self.admin.pk}')
+        self.assertEqual(len(b''.join(response.streaming_content).decode().splitlines()), 1)
+        for url in ('/api/accounts/admin/activity-logs/export/?user_id=abc',
+                    '/api/accounts/admin/activity-logs/?user_id=abc'):
+            self.assertEqual(self.client.get(url).status_code, 400, url)
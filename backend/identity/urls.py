@@ -5,7 +5,7 @@ from .views import (
     AdminPasswordResetView
 )
 from .activity_views import (
-    AdminActivityLogsView, AdminFailedLoginsView, 
+    AdminActivityLogsView, AdminActivityLogExportView, AdminFailedLoginsView, 
     AdminSuspiciousActivityView, AdminActivityStatsView
 )
 from rest_framework.routers import DefaultRouter
@@ -30,6 +30,7 @@ urlpatterns = [
     
     # Admin activity logging endpoints
     path('admin/activity-logs/', AdminActivityLogsView.as_view(), name='admin-activity-logs'),
+    path('admin/activity-logs/export/', AdminActivityLogExportView.as_view(), name='admin-activity-logs-export'),
     path('admin/failed-logins/', AdminFailedLoginsView.as_view(), name='admin-failed-logins'),
     path('admin/suspicious-activity/', AdminSuspiciousActivityView.as_view(), name='admin-suspicious-activity'),
     path('admin/activity-stats/', AdminActivityStatsView.as_view(), name='admin-activity-stats'),
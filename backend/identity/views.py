@@ -6,6 +6,7 @@ from rest_framework import status
 from .permissions import IsAdmin
 from .serializers import AdminCreateUserSerializer, NotificationSerializer
 from .models import Profile, Notification
+from .pagination import NotificationPagination, UserPagination
 from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
 
@@ -35,7 +36,8 @@ class UsersView(APIView):
     permission_classes = [IsAuthenticated, IsAdmin]
 
     def get(self, request):
-        users = User.objects.all()
+        paginator = UserPagination()
+        users = paginator.paginate_queryset(User.objects.select_related('profile'), request, view=self)
         users_data = []
         for user in users:
             profile = _get_profile(user)
@@ -49,7 +51,7 @@ class UsersView(APIView):
                 "role": profile.role if profile else None,
                 "phone": profile.phone if profile else None
             })
-        return Response(users_data)
+        return paginator.get_paginated_response(users_data)
 
 class AdminCreateUserView(APIView):
     permission_classes = [IsAuthenticated, IsAdmin]
@@ -116,8 +118,9 @@ class AdminUserManagementView(APIView):
         }, status=status.HTTP_201_CREATED)
 
     def get(self, request):
-        """View all users with roles"""
-        users = User.objects.all().select_related('profile')
+        """View all users with roles, one keyset page at a time"""
+        paginator = UserPagination()
+        users = paginator.paginate_queryset(User.objects.select_related('profile'), request, view=self)
         users_data = []
         for user in users:
             profile = _get_profile(user)
@@ -136,7 +139,9 @@ class AdminUserManagementView(APIView):
         return Response({
             "success": True,
             "message": "Users retrieved successfully",
-            "data": users_data
+            "data": users_data,
+            "count": paginator.count,
+            "next": paginator.get_next_link()
         })
 
 class AdminUserToggleView(APIView):
@@ -216,6 +221,7 @@ class NotificationViewSet(viewsets.ModelViewSet):
     queryset = Notification.objects.all()
     serializer_class = NotificationSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = NotificationPagination
 
     def get_queryset(self):
         # Only show notifications for the current user
@@ -35,3 +35,19 @@ export const apiFetch = (path, options = {}) => {
   }
   return fetch(url, { ...options, headers });
 };
+
+// Walks a keyset-paginated list endpoint by its `next` links and returns every row.
+export const apiFetchAll = async (path) => {
+  const rows = [];
+  let url = `${path}${path.includes('?') ? '&' : '?'}page_size=200&count=false`;
+  while (url) {
+    const res = await apiFetch(url);
+    if (!res.ok) {
+      throw new Error(await res.text());
+    }
+    const page = await res.json();
+    rows.push(...page.results);
+    url = page.next;
+  }
+  return rows;
+};
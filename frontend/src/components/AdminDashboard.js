@@ -47,8 +47,14 @@ const AdminDashboard = ({ user, onLogout }) => {
 
   const fetchUsers = async () => {
     try {
-      const response = await apiClient.get('/api/accounts/admin/users/');
-      setUsers(response.data.data);
+      const rows = [];
+      let url = '/api/accounts/admin/users/?page_size=200&count=false';
+      while (url) {
+        const response = await apiClient.get(url);
+        rows.push(...response.data.data);
+        url = response.data.next;
+      }
+      setUsers(rows);
     } catch (err) {
       console.error('Failed to fetch users:', err);
     }
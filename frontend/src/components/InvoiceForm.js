@@ -1,5 +1,5 @@
 import React, { useState, useEffect } from 'react';
-import { apiFetch } from '../api';
+import PurchaseOrderPicker from './PurchaseOrderPicker';
 
 const styles = {
   form: {
@@ -74,21 +74,6 @@ export default function InvoiceForm({ onSubmit, onCancel, initialData }) {
     total_amount: '',
     status: ''
   });
-  const [orders, setOrders] = useState([]);
-
-  useEffect(() => {
-    // Fetch purchase orders
-    apiFetch('/api/vendor/purchase-orders/')
-      .then(res => res.json())
-      .then(data => {
-        const normalized = Array.isArray(data) ? data : [];
-        setOrders(normalized);
-      })
-      .catch(err => {
-        console.error('Purchase order fetch error:', err);
-        setOrders([]);
-      });
-  }, []);
 
   useEffect(() => {
     if (initialData) {
@@ -116,12 +101,15 @@ export default function InvoiceForm({ onSubmit, onCancel, initialData }) {
     <form onSubmit={handleSubmit} style={styles.form}>
       <div style={styles.formGroup}>
         <label style={styles.label}>Order</label>
-        <select name="purchase_order" value={form.purchase_order} onChange={handleChange} style={styles.select} required>
-          <option value="">Select Order</option>
-          {orders.map(o => (
-            <option key={o.order_id} value={o.order_id}>{o.po_reference_number}</option>
-          ))}
-        </select>
+        <PurchaseOrderPicker
+          value={form.purchase_order}
+          onChange={handleChange}
+          initialOrder={initialData?.purchase_order
+            ? { order_id: initialData.purchase_order, po_reference_number: initialData.purchase_order_ref }
+            : null}
+          inputStyle={styles.input}
+          selectStyle={styles.select}
+        />
       </div>
       <div style={styles.formGroup}>
         <label style={styles.label}>Invoice Number</label>
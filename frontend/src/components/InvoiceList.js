@@ -2,7 +2,7 @@
 import React, { useEffect, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
 import InvoiceForm from './InvoiceForm';
-import { apiFetch } from '../api';
+import { apiFetch, apiFetchAll } from '../api';
 
 const styles = {
   addButton: {
@@ -46,18 +46,8 @@ function InvoiceList() {
 
   const fetchInvoices = () => {
     setLoading(true);
-    apiFetch('/api/vendor/purchase-invoices/')
-      .then(async res => {
-        if (!res.ok) {
-          const text = await res.text();
-          throw new Error(text);
-        }
-        return res.json();
-      })
-      .then(data => {
-        const normalized = Array.isArray(data) ? data : [];
-        setInvoices(normalized);
-      })
+    apiFetchAll('/api/vendor/purchase-invoices/')
+      .then(rows => setInvoices(rows))
       .catch(() => {
         setInvoices([]);
       })
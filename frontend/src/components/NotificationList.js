@@ -1,6 +1,6 @@
 import React, { useEffect, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
-import { apiFetch } from '../api';
+import { apiFetchAll } from '../api';
 
 const styles = {
   container: {
@@ -109,15 +109,8 @@ function NotificationList() {
   const [notifications, setNotifications] = useState([]);
 
   useEffect(() => {
-    apiFetch('/api/accounts/notifications/')
-      .then(async res => {
-        if (!res.ok) {
-          const text = await res.text();
-          throw new Error(text);
-        }
-        return res.json();
-      })
-      .then(data => setNotifications(data))
+    apiFetchAll('/api/accounts/notifications/')
+      .then(rows => setNotifications(rows))
       .catch(() => {
         setNotifications([]);
       });
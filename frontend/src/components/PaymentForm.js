@@ -1,5 +1,6 @@
 import React, { useState, useEffect } from 'react';
-import { apiFetch } from '../api';
+import { apiFetchAll } from '../api';
+import PurchaseOrderPicker from './PurchaseOrderPicker';
 
 const styles = {
   form: {
@@ -74,31 +75,15 @@ export default function PaymentForm({ onSubmit, onCancel, initialData }) {
     payment_method: ''
   });
   const [suppliers, setSuppliers] = useState([]);
-  const [orders, setOrders] = useState([]);
 
   useEffect(() => {
     // Fetch suppliers
-    apiFetch('/api/vendor/suppliers/')
-      .then(res => res.json())
-      .then(data => {
-        const normalized = Array.isArray(data) ? data : [];
-        setSuppliers(normalized);
-      })
+    apiFetchAll('/api/vendor/suppliers/?fields=supplier_id,supplier_name')
+      .then(setSuppliers)
       .catch(err => {
         console.error('Supplier fetch error:', err);
         setSuppliers([]);
       });
-    // Fetch purchase orders
-    apiFetch('/api/vendor/purchase-orders/')
-      .then(res => res.json())
-      .then(data => {
-        const normalized = Array.isArray(data) ? data : [];
-        setOrders(normalized);
-      })
-      .catch(err => {
-        console.error('Purchase order fetch error:', err);
-        setOrders([]);
-      });
   }, []);
 
   useEffect(() => {
@@ -135,12 +120,15 @@ export default function PaymentForm({ onSubmit, onCancel, initialData }) {
       </div>
       <div style={styles.formGroup}>
         <label style={styles.label}>Order</label>
-        <select name="purchase_order" value={form.purchase_order} onChange={handleChange} style={styles.select} required>
-          <option value="">Select Order</option>
-          {orders.map(o => (
-            <option key={o.order_id} value={o.order_id}>{o.po_reference_number}</option>
-          ))}
-        </select>
+        <PurchaseOrderPicker
+          value={form.purchase_order}
+          onChange={handleChange}
+          initialOrder={initialData?.purchase_order
+            ? { order_id: initialData.purchase_order, po_reference_number: initialData.purchase_order_ref }
+            : null}
+          inputStyle={styles.input}
+          selectStyle={styles.select}
+        />
       </div>
       <div style={styles.formGroup}>
         <label style={styles.label}>Amount</label>
@@ -2,7 +2,7 @@
 import React, { useEffect, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
 import PaymentForm from './PaymentForm';
-import { apiFetch } from '../api';
+import { apiFetch, apiFetchAll } from '../api';
 
 const styles = {
   addButton: {
@@ -46,18 +46,8 @@ function PaymentList() {
 
   const fetchPayments = () => {
     setLoading(true);
-    apiFetch('/api/vendor/supplier-payments/')
-      .then(async res => {
-        if (!res.ok) {
-          const text = await res.text();
-          throw new Error(text);
-        }
-        return res.json();
-      })
-      .then(data => {
-        const normalized = Array.isArray(data) ? data : [];
-        setPayments(normalized);
-      })
+    apiFetchAll('/api/vendor/supplier-payments/')
+      .then(rows => setPayments(rows))
       .catch(() => {
         setPayments([]);
       })
@@ -0,0 +1,67 @@
+import React, { useState, useEffect } from 'react';
+import { apiFetch } from '../api';
+
+// Order select for the payment and invoice forms. The references endpoint only returns the
+// latest page, so typing narrows it to references starting with the text (?search=).
+export default function PurchaseOrderPicker({ value, onChange, initialOrder, inputStyle, selectStyle }) {
+  const [search, setSearch] = useState('');
+  const [orders, setOrders] = useState([]);
+  const [selected, setSelected] = useState(null);
+
+  useEffect(() => {
+    const query = search.trim();
+    let cancelled = false;
+    const timer = setTimeout(() => {
+      const params = query ? `?search=${encodeURIComponent(query)}` : '';
+      apiFetch(`/api/vendor/purchase-orders/references/${params}`)
+        .then(res => res.json())
+        .then(data => {
+          if (!cancelled) {
+            setOrders(Array.isArray(data?.results) ? data.results : []);
+          }
+        })
+        .catch(err => {
+          console.error('Purchase order fetch error:', err);
+          if (!cancelled) {
+            setOrders([]);
+          }
+        });
+    }, query ? 300 : 0);
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [search]);
+
+  const handleSelect = e => {
+    const order = orders.find(o => String(o.order_id) === e.target.value);
+    if (order) {
+      setSelected(order);
+    }
+    onChange(e);
+  };
+
+  // Keep the chosen order (or the one being edited) selectable when a search leaves it out.
+  const current = [selected, initialOrder].find(o => o && String(o.order_id) === String(value));
+
+  return (
+    <>
+      <input
+        type="search"
+        placeholder="Search by reference"
+        value={search}
+        onChange={e => setSearch(e.target.value)}
+        style={{ ...inputStyle, marginBottom: '8px' }}
+      />
+      <select name="purchase_order" value={value} onChange={handleSelect} style={selectStyle} required>
+        <option value="">Select Order</option>
+        {current && !orders.some(o => String(o.order_id) === String(current.order_id)) && (
+          <option value={current.order_id}>{current.po_reference_number}</option>
+        )}
+        {orders.map(o => (
+          <option key={o.order_id} value={o.order_id}>{o.po_reference_number}</option>
+        ))}
+      </select>
+    </>
+  );
+}
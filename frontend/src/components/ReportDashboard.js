@@ -1,8 +1,9 @@
 
-import React, { useEffect, useState } from 'react';
+import React, { useEffect, useRef, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
 import jsPDF from 'jspdf';
 import autoTable from 'jspdf-autotable';
+import { ResponsiveContainer, BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip } from 'recharts';
 import { apiFetch } from '../api';
 
 const styles = {
@@ -102,17 +103,25 @@ const styles = {
 function ReportDashboard() {
   const navigate = useNavigate();
   const [report, setReport] = useState(null);
+  const [trend, setTrend] = useState([]);
   const [stock, setStock] = useState([]);
+  const [stockCounts, setStockCounts] = useState(null);
   const [suppliers, setSuppliers] = useState([]);
   const [filterType, setFilterType] = useState('month');
   const [date, setDate] = useState(() => new Date().toISOString().slice(0, 10));
 
-  const fetchReport = () => {
+  const loadedRef = useRef(false);
+
+  // One request for every tile on first load; a period change only refreshes the purchase tiles.
+  const fetchSummary = (sections) => {
     const params = new URLSearchParams({
       filter_type: filterType,
       date: date
     });
-    apiFetch(`/api/vendor/reports/monthly_purchases/?${params.toString()}`)
+    if (sections) {
+      params.set('sections', sections.join(','));
+    }
+    apiFetch(`/api/vendor/reports/summary/?${params.toString()}`)
       .then(async res => {
         if (!res.ok) {
           const text = await res.text();
@@ -121,51 +130,36 @@ function ReportDashboard() {
         return res.json();
       })
       .then(data => {
-        const normalized = data && Object.keys(data).length > 0 ? data : null;
-        setReport(normalized);
+        if (data?.purchases) {
+          setReport(Object.keys(data.purchases).length > 0 ? data.purchases : null);
+        }
+        if (data?.trend) {
+          const series = data.trend.series?.[0];
+          setTrend((data.trend.buckets || []).map((bucket, idx) => ({
+            period: bucket,
+            total: Number(series?.total_amount?.[idx] || 0),
+            orders: series?.order_count?.[idx] || 0
+          })));
+        }
+        if (data?.stock) {
+          setStock(Array.isArray(data.stock.parts) ? data.stock.parts : []);
+          setStockCounts({ low: data.stock.low_stock_count, total: data.stock.part_count });
+        }
+        if (data?.suppliers) {
+          setSuppliers(Array.isArray(data.suppliers) ? data.suppliers : []);
+        }
       })
       .catch(() => {
         setReport(null);
+        setTrend([]);
       });
   };
 
   useEffect(() => {
-    fetchReport();
+    fetchSummary(loadedRef.current ? ['purchases', 'trend'] : null);
+    loadedRef.current = true;
   }, [filterType, date]);
 
-  useEffect(() => {
-    apiFetch('/api/vendor/reports/stock_levels/')
-      .then(async res => {
-        if (!res.ok) {
-          const text = await res.text();
-          throw new Error(text);
-        }
-        return res.json();
-      })
-      .then(data => {
-        const normalized = Array.isArray(data?.stock) ? data.stock : [];
-        setStock(normalized);
-      })
-      .catch(() => {
-        setStock([]);
-      });
-    apiFetch('/api/vendor/reports/supplier_summary/')
-      .then(async res => {
-        if (!res.ok) {
-          const text = await res.text();
-          throw new Error(text);
-        }
-        return res.json();
-      })
-      .then(data => {
-        const normalized = Array.isArray(data?.suppliers) ? data.suppliers : [];
-        setSuppliers(normalized);
-      })
-      .catch(() => {
-        setSuppliers([]);
-      });
-  }, []);
-
   // PDF download handler
   const handleDownloadPDF = () => {
     const doc = new jsPDF();
@@ -214,10 +208,24 @@ function ReportDashboard() {
             {report.period && <span style={{color: '#57606a', marginLeft: '10px'}}>({report.period})</span>}
           </div>
         )}
+        {trend.length > 0 && (
+          <ResponsiveContainer width="100%" height={240}>
+            <BarChart data={trend}>
+              <CartesianGrid strokeDasharray="3 3" stroke="#e2e8f0" />
+              <XAxis dataKey="period" />
+              <YAxis />
+              <Tooltip />
+              <Bar dataKey="total" name="Total Spend" fill="var(--primary-blue)" radius={[6, 6, 0, 0]} />
+            </BarChart>
+          </ResponsiveContainer>
+        )}
       </div>
 
       <div style={styles.section}>
         <h2 style={styles.subheading}>Stock Health</h2>
+        {stockCounts && (
+          <p style={{color: '#57606a'}}>{stockCounts.low} of {stockCounts.total} parts at or below their reorder level</p>
+        )}
         {stock.length > 0 ? (
           <div style={styles.tableContainer}>
             <table style={styles.table}>
@@ -225,7 +233,7 @@ function ReportDashboard() {
                 <tr style={{backgroundColor: '#15803d'}}>
                   <th style={styles.tableHeader}>Item</th>
                   <th style={styles.tableHeader}>Current Stock</th>
-                  <th style={styles.tableHeader}>Min Level</th>
+                  <th style={styles.tableHeader}>Reorder Level</th>
                 </tr>
               </thead>
               <tbody>
@@ -233,7 +241,7 @@ function ReportDashboard() {
                   <tr key={idx} style={idx % 2 === 0 ? styles.tableRowAlt : {}}>
                     <td style={styles.tableCell}>{item.part_name}</td>
                     <td style={styles.tableCell}>{item.current_stock}</td>
-                    <td style={styles.tableCell}>{item.minimum_level}</td>
+                    <td style={styles.tableCell}>{item.reorder_level}</td>
                   </tr>
                 ))}
               </tbody>
@@ -260,7 +268,7 @@ function ReportDashboard() {
                 {suppliers.map((supplier, idx) => (
                   <tr key={idx} style={idx % 2 === 0 ? styles.tableRowAlt : {}}>
                     <td style={styles.tableCell}>{supplier.supplier_name}</td>
-                    <td style={styles.tableCell}>{supplier.total_orders}</td>
+                    <td style={styles.tableCell}>{supplier.order_count}</td>
                     <td style={styles.tableCell}>${supplier.outstanding_balance || 0}</td>
                   </tr>
                 ))}
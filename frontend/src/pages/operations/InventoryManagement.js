@@ -1,5 +1,5 @@
 import React, { useState, useEffect } from 'react';
-import { apiClient } from '../../api';
+import { apiClient, apiFetchAll } from '../../api';
 import { useNavigate } from 'react-router-dom';
 import '../../styles/vendorDashboard/VendorManagement.css';
 
@@ -13,6 +13,7 @@ const InventoryManagement = ({ user }) => {
         description: '',
         unit_price: '',
         current_stock: '',
+        reorder_level: '',
         supplier: ''
     });
     const [suppliers, setSuppliers] = useState([]);
@@ -24,8 +25,7 @@ const InventoryManagement = ({ user }) => {
 
     const fetchParts = async () => {
         try {
-            const res = await apiClient.get('/api/vendor/parts/');
-            setParts(res.data);
+            setParts(await apiFetchAll('/api/vendor/parts/'));
         } catch (err) {
             console.error('Error fetching parts:', err);
         }
@@ -33,8 +33,7 @@ const InventoryManagement = ({ user }) => {
 
     const fetchSuppliers = async () => {
         try {
-            const res = await apiClient.get('/api/vendor/suppliers/');
-            setSuppliers(res.data);
+            setSuppliers(await apiFetchAll('/api/vendor/suppliers/?fields=supplier_id,supplier_name'));
         } catch (err) {
             console.error('Error fetching suppliers:', err);
         }
@@ -48,6 +47,7 @@ const InventoryManagement = ({ user }) => {
             description: part.description || '',
             unit_price: part.unit_price,
             current_stock: part.current_stock,
+            reorder_level: part.reorder_level,
             supplier: part.supplier
         });
     };
@@ -84,8 +84,10 @@ const InventoryManagement = ({ user }) => {
         }
     };
 
-    const getStockBadge = (stock) => {
-        if (stock <= 5) return 'badge inactive';
+    const isLowStock = (part) => part.current_stock <= part.reorder_level;
+
+    const getStockBadge = (part) => {
+        if (isLowStock(part)) return 'badge inactive';
         return 'badge active';
     };
 
@@ -113,6 +115,7 @@ const InventoryManagement = ({ user }) => {
                                     <input type="number" name="current_stock" placeholder="Current Stock" value={formData.current_stock} onChange={handleChange} required />
                                 </div>
                                 <div className="form-row">
+                                    <input type="number" name="reorder_level" placeholder="Reorder Level" value={formData.reorder_level} onChange={handleChange} min="0" required />
                                     <select name="supplier" value={formData.supplier} onChange={handleChange} required>
                                         <option value="">Select Vendor</option>
                                         {suppliers.map(s => (
@@ -152,8 +155,8 @@ const InventoryManagement = ({ user }) => {
                                     <td>${part.unit_price}</td>
                                     <td>{part.current_stock}</td>
                                     <td>
-                                        <span className={getStockBadge(part.current_stock)}>
-                                            {part.current_stock <= 5 ? 'Low Stock' : 'In Stock'}
+                                        <span className={getStockBadge(part)}>
+                                            {isLowStock(part) ? 'Low Stock' : 'In Stock'}
                                         </span>
                                     </td>
                                     {user?.role === 'ADMIN' && (
@@ -12,7 +12,7 @@ import {
   Bar,
   Legend
 } from 'recharts';
-import { apiFetch } from '../../api';
+import { apiFetch, apiFetchAll } from '../../api';
 
 const VendorScorecard = () => {
   const navigate = useNavigate();
@@ -23,12 +23,8 @@ const VendorScorecard = () => {
 
   const fetchVendors = () => {
     setLoading(true);
-    apiFetch('/api/vendor/suppliers/')
-      .then(res => res.json())
-      .then(data => {
-        const normalized = Array.isArray(data) ? data : [];
-        setVendors(normalized);
-      })
+    apiFetchAll('/api/vendor/suppliers/')
+      .then(setVendors)
       .catch(() => setVendors([]))
       .finally(() => setLoading(false));
   };
@@ -41,13 +37,34 @@ const VendorScorecard = () => {
       .catch(() => setUserRole(''));
   }, []);
 
+  const pollRecalculation = (jobId) => {
+    apiFetch(`/api/vendor/vendor-scores/recalculate/${jobId}/`)
+      .then(res => res.json())
+      .then(job => {
+        if (job?.status === 'Pending' || job?.status === 'Running') {
+          setTimeout(() => pollRecalculation(jobId), 2000);
+          return;
+        }
+        fetchVendors();
+        setRecalcLoading(false);
+      })
+      .catch(() => setRecalcLoading(false));
+  };
+
   const handleRecalculate = () => {
     setRecalcLoading(true);
     apiFetch('/api/vendor/vendor-scores/recalculate/', {
       method: 'POST',
     })
-      .then(() => fetchVendors())
-      .finally(() => setRecalcLoading(false));
+      .then(res => res.json())
+      .then(job => {
+        if (job?.job_id) {
+          pollRecalculation(job.job_id);
+        } else {
+          setRecalcLoading(false);
+        }
+      })
+      .catch(() => setRecalcLoading(false));
   };
 
   const metrics = useMemo(() => {
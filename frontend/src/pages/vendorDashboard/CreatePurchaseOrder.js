@@ -1,5 +1,5 @@
 import React, { useState, useEffect } from 'react';
-import { apiClient } from '../../api';
+import { apiClient, apiFetchAll } from '../../api';
 import { useNavigate } from 'react-router-dom';
 import '../../styles/vendorDashboard/VendorManagement.css';
 
@@ -20,15 +20,13 @@ const CreatePurchaseOrder = () => {
 
     const fetchSuppliers = async () => {
         try {
-            const res = await apiClient.get('/api/vendor/suppliers/');
-            setSuppliers(res.data);
+            setSuppliers(await apiFetchAll('/api/vendor/suppliers/?fields=supplier_id,supplier_name'));
         } catch (err) { console.error("Error fetching suppliers:", err); }
     };
 
     const fetchAllParts = async () => {
         try {
-            const res = await apiClient.get('/api/vendor/parts/');
-            setAllParts(res.data);
+            setAllParts(await apiFetchAll('/api/vendor/parts/'));
         } catch (err) { console.error("Error fetching parts:", err); }
     };
 
@@ -1,5 +1,5 @@
 import React, { useState, useEffect } from 'react';
-import { apiClient } from '../../api';
+import { apiClient, apiFetchAll } from '../../api';
 import { useNavigate } from 'react-router-dom';
 import '../../styles/vendorDashboard/ProductManagement.css';
 
@@ -45,8 +45,7 @@ const ProductManagement = () => {
 
     const fetchProducts = async () => {
         try {
-            const res = await apiClient.get('/api/vendor/parts/');
-            const normalized = Array.isArray(res.data) ? res.data : [];
+            const normalized = await apiFetchAll('/api/vendor/parts/');
             setProducts(normalized.length > 0 ? normalized : sampleProducts);
         } catch (err) {
             console.error("Error fetching products:", err);
@@ -56,8 +55,7 @@ const ProductManagement = () => {
 
     const fetchSuppliers = async () => {
         try {
-            const res = await apiClient.get('/api/vendor/suppliers/');
-            const normalized = Array.isArray(res.data) ? res.data : [];
+            const normalized = await apiFetchAll('/api/vendor/suppliers/?fields=supplier_id,supplier_name');
             setSuppliers(normalized.length > 0 ? normalized : sampleSuppliers);
         } catch (err) {
             console.error("Error fetching suppliers:", err);
@@ -6,6 +6,7 @@ import '../../styles/vendorDashboard/VendorManagement.css';
 const PurchaseOrderList = ({ user }) => {
     const navigate = useNavigate();
     const [orders, setOrders] = useState([]);
+    const [nextPage, setNextPage] = useState(null);
 
     const currentUser = user || JSON.parse(localStorage.getItem('user') || '{}');
 
@@ -16,7 +17,18 @@ const PurchaseOrderList = ({ user }) => {
     const fetchOrders = async () => {
         try {
             const res = await apiClient.get('/api/vendor/purchase-orders/');
-            setOrders(res.data);
+            setOrders(res.data.results);
+            setNextPage(res.data.next);
+        } catch (err) {
+            console.error("Error fetching orders:", err);
+        }
+    };
+
+    const fetchMoreOrders = async () => {
+        try {
+            const res = await apiClient.get(nextPage);
+            setOrders(prev => [...prev, ...res.data.results]);
+            setNextPage(res.data.next);
         } catch (err) {
             console.error("Error fetching orders:", err);
         }
@@ -172,6 +184,11 @@ const PurchaseOrderList = ({ user }) => {
                             </tbody>
                         </table>
                     </div>
+                    {nextPage && (
+                        <div style={{ padding: '1rem', textAlign: 'center', borderTop: '1px solid var(--border-color)' }}>
+                            <button className="btn-secondary" onClick={fetchMoreOrders}>Load more</button>
+                        </div>
+                    )}
                 </div>
             </div>
         </div>
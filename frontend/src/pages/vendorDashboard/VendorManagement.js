@@ -1,5 +1,5 @@
 import React, { useState, useEffect, useMemo, useRef } from 'react';
-import { apiClient } from '../../api';
+import { apiClient, apiFetchAll } from '../../api';
 import { useNavigate } from 'react-router-dom';
 import { PieChart, Pie, Cell, ResponsiveContainer, Tooltip, Legend } from 'recharts';
 import '../../styles/vendorDashboard/VendorManagement.css';
@@ -128,8 +128,7 @@ const VendorManagement = () => {
 
     const fetchSuppliers = async () => {
         try {
-            const res = await apiClient.get('/api/vendor/suppliers/');
-            const normalized = Array.isArray(res.data) ? res.data : [];
+            const normalized = await apiFetchAll('/api/vendor/suppliers/');
             setSuppliers(normalized.length > 0 ? normalized : sampleSuppliers);
         } catch (err) {
             console.error('Fetch error:', err);